@@ -1,4 +1,5 @@
 import re
+import threading
 from typing import Any, Optional, TypeAlias
 from .dtypes import ArrayLike
 import numpy
@@ -15,6 +16,7 @@ __all__ = [
     "move_to_device",
     "set_nn_device",
     "get_nn_device",
+    "use_async_memory_pool",
 ]
 
 _MAX_LINE_WIDTH = 200
@@ -24,23 +26,80 @@ _FLOAT_MODE = "maxprec_equal"
 _CPU_BACKEND = numpy
 _CPU_BACKEND.set_printoptions(precision=_PRECISION, linewidth=_MAX_LINE_WIDTH, floatmode=_FLOAT_MODE)
 
-try:
-    import cupy
-
-    _CUDA_BACKEND = cupy
-    _CUDA_BACKEND.set_printoptions(precision=_PRECISION, linewidth=_MAX_LINE_WIDTH, floatmode=_FLOAT_MODE)
-except ImportError:
-    _CUDA_BACKEND = None
+_CUDA_BACKEND: Any = None
+_cuda_backend_loaded = False
+_cuda_backend_lock = threading.Lock()
+
+
+def _load_cuda_backend() -> Any:
+    # CuPy is imported on first use so CPU-only processes never pay for CUDA driver start-up.
+    global _CUDA_BACKEND, _cuda_backend_loaded
+    if _cuda_backend_loaded:
+        return _CUDA_BACKEND
+    with _cuda_backend_lock:
+        if not _cuda_backend_loaded:
+            try:
+                import cupy
+            except ImportError:
+                pass
+            else:
+                cupy.set_printoptions(precision=_PRECISION, linewidth=_MAX_LINE_WIDTH, floatmode=_FLOAT_MODE)
+                _CUDA_BACKEND = cupy
+                if cupy.cuda.is_available() and _cuda_seed is not None:
+                    _seed_cuda_devices(_cuda_seed)
+            # Published only once setup is done, so other threads never see a half-loaded backend.
+            _cuda_backend_loaded = True
+    return _CUDA_BACKEND
 
 
 def cuda_available():
-    return _CUDA_BACKEND is not None and _CUDA_BACKEND.cuda.is_available()
+    backend = _load_cuda_backend()
+    return backend is not None and backend.cuda.is_available()
+
+
+def _seed_cuda_devices(seed: int) -> None:
+    for dev_id in range(_CUDA_BACKEND.cuda.runtime.getDeviceCount()):
+        with _CUDA_BACKEND.cuda.Device(dev_id):
+            _CUDA_BACKEND.random.seed(seed + dev_id)
+
+
+def use_async_memory_pool() -> bool:
+    # Opt-in: this replaces CuPy's process-wide allocator with stream-ordered sub-allocation.
+    # Returns False when CUDA, or cudaMallocAsync support in CuPy/the driver, is missing.
+    if not cuda_available():
+        return False
+    try:
+        _CUDA_BACKEND.cuda.set_allocator(_CUDA_BACKEND.cuda.MemoryAsyncPool().malloc)
+    except (AttributeError, RuntimeError):
+        return False
+    return True
+
+
+_CPU_RNG = numpy.random.default_rng()
+
+_cuda_seed: Optional[int] = None
+_rng_generation = 0
 
 
 def set_random_seed(seed: int):
+    global _CPU_RNG, _cuda_seed, _rng_generation
+    _rng_generation += 1
+    _CPU_RNG = numpy.random.default_rng(seed)
     _CPU_BACKEND.random.seed(seed)
-    if cuda_available():
-        _CUDA_BACKEND.random.seed(seed)
+    # An unloaded CUDA backend picks the seed up when it is first initialized.
+    with _cuda_backend_lock:
+        _cuda_seed = seed
+        if _CUDA_BACKEND is not None and _CUDA_BACKEND.cuda.is_available():
+            _seed_cuda_devices(seed)
+
+
+def _get_random_generator(device: "Device") -> Any:
+    # CPU draws go through a PCG64 Generator; CuPy's module-level API already takes dtype=.
+    return _CPU_RNG if device.dev_type == "cpu" else device.xp.random
+
+
+def _get_rng_generation() -> int:
+    return _rng_generation
 
 
 def array_to_string(data: ArrayLike, prefix: str) -> str:
@@ -55,13 +114,17 @@ def array_to_string(data: ArrayLike, prefix: str) -> str:
     )
 
 
+_DEVICE_PATTERN = re.compile(r"(cpu|cuda)(?::(\d+))?")
+
+
 def _get_type_and_id(device_type: str) -> tuple[str, Optional[int]]:
-    match = re.match(r"(?P<type>cpu|cuda)(?::(?P<id>\d+))?", device_type)
+    if device_type == "cpu":
+        return "cpu", None
+    match = _DEVICE_PATTERN.fullmatch(device_type)
     if match:
-        device_type = match.group("type")
+        device_type, device_id = match.groups()
         if device_type == "cuda":
             assert cuda_available(), "CUDA is not available."
-        device_id = match.group("id")
         return device_type, None if device_id is None else int(device_id)
     raise ValueError(f"Unknown device: {device_type}")
 
@@ -71,7 +134,9 @@ class Device:
         dev_type, dev_id = _get_type_and_id(dev_type)
         self.dev_type = dev_type
         self.dev_id = dev_id
-        self.xp = _CPU_BACKEND if dev_type == "cpu" else _CUDA_BACKEND
+        self.xp = _CPU_BACKEND if dev_type == "cpu" else _load_cuda_backend()
+        # A bare "cuda" follows whichever device is current on entry, so only pinned ids are cached.
+        self._cuda_device = self.xp.cuda.Device(dev_id) if dev_id is not None else None
 
     def __eq__(self, other: Any) -> bool:
         return (
@@ -89,22 +154,34 @@ class Device:
         return f"{self.dev_type}{id_suffix}"
 
     def __enter__(self) -> None:
-        if self.dev_type == "cpu":
+        if self._cuda_device is None:
             return None
-        return _CUDA_BACKEND.cuda.Device(self.dev_id).__enter__()
+        return self._cuda_device.__enter__()
 
     def __exit__(self, *args: Any) -> None:
-        if self.dev_type == "cpu":
+        if self._cuda_device is None:
             return None
-        return _CUDA_BACKEND.cuda.Device(self.dev_id).__exit__(*args)
+        return self._cuda_device.__exit__(*args)
 
 
 DeviceLike: TypeAlias = Device | str
 
+_CPU_DEVICE = Device("cpu")
+_CUDA_DEVICES: dict[int, Device] = {}
+_ARRAY_TYPE_TO_DEVICE: dict[type, Device] = {numpy.ndarray: _CPU_DEVICE}
+_DEVICE_CACHE: dict[str, Device] = {"cpu": _CPU_DEVICE}
+
+
+def _get_cuda_device(dev_id: int) -> Device:
+    device = _CUDA_DEVICES.get(dev_id)
+    if device is None:
+        device = _CUDA_DEVICES[dev_id] = Device(f"cuda:{dev_id}")
+    return device
+
 
 def get_available_devices() -> list[str]:
     devices = ["cpu"]
-    if _CUDA_BACKEND is not None:
+    if _load_cuda_backend() is not None:
         num_cuda_devices = _CUDA_BACKEND.cuda.runtime.getDeviceCount()
         cuda_devices = [f"cuda:{i}" for i in range(num_cuda_devices)]
         devices.extend(cuda_devices)
@@ -112,36 +189,49 @@ def get_available_devices() -> list[str]:
 
 
 def get_array_device(x: ArrayLike) -> Device:
-    return Device("cpu") if "numpy" in str(type(x)) else Device("cuda:0")
+    device = _ARRAY_TYPE_TO_DEVICE.get(type(x))
+    if device is not None:
+        return device
+    if type(x).__module__.startswith("cupy") and isinstance(x, _load_cuda_backend().ndarray):
+        return _get_cuda_device(x.device.id)
+    _ARRAY_TYPE_TO_DEVICE[type(x)] = _CPU_DEVICE
+    return _CPU_DEVICE
 
 
-def select_device(device: Optional[DeviceLike]) -> Device:
+def parse_device(device: Optional[DeviceLike]) -> Device:
+    if device is None:
+        return _CPU_DEVICE
     if isinstance(device, Device):
         return device
-    return Device(device or "cpu")
+    parsed = _DEVICE_CACHE.get(device)
+    if parsed is None:
+        parsed = _DEVICE_CACHE[device] = Device(device)
+    return parsed
 
 
-def parse_device(device: DeviceLike) -> Device:
-    return device if isinstance(device, Device) else Device(device)
+select_device = parse_device
 
 
 def move_to_device(data: ArrayLike, device: Device) -> ArrayLike:
-    if device == Device("cpu"):
-        return _CUDA_BACKEND.asnumpy(data)
+    if get_array_device(data) == device:
+        return data
+    if device.dev_type == "cpu":
+        return _load_cuda_backend().asnumpy(data)
     assert cuda_available(), "CUDA is not available."
-    return cupy.asarray(data)
+    with device:
+        return _CUDA_BACKEND.asarray(data)
 
 
-_NN_DEVICE = Device("cpu")
+_NN_DEVICE = _CPU_DEVICE
 
 
 def set_nn_device(device: str) -> None:
     global _NN_DEVICE
     devices = get_available_devices()
     if device in devices:
-        _NN_DEVICE = Device(device)
+        _NN_DEVICE = parse_device(device)
     else:
-        _NN_DEVICE = Device("cpu")
+        _NN_DEVICE = _CPU_DEVICE
         print(f">>> {device} is not available, Using CPU as default ...")
 
 
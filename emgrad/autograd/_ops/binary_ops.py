@@ -3,6 +3,8 @@ from emgrad.dtypes import ArrayLike
 
 
 class Add(Op):
+    __slots__ = ()
+
     def forward(self, x1: ArrayLike, x2: ArrayLike) -> ArrayLike:
         y = x1 + x2
         return y
@@ -14,6 +16,8 @@ class Add(Op):
 
 
 class Sub(Op):
+    __slots__ = ()
+
     def forward(self, x1: ArrayLike, x2: ArrayLike) -> ArrayLike:
         y = x1 - x2
         return y
@@ -25,6 +29,8 @@ class Sub(Op):
 
 
 class Mul(Op):
+    __slots__ = ()
+
     def forward(self, x1: ArrayLike, x2: ArrayLike) -> ArrayLike:
         y = x1 * x2
         self.save_to_cache(x1, x2)
@@ -38,6 +44,8 @@ class Mul(Op):
 
 
 class Div(Op):
+    __slots__ = ()
+
     def forward(self, x1: ArrayLike, x2: ArrayLike) -> ArrayLike:
         y = x1 / x2
         self.save_to_cache(x1, x2)
@@ -51,6 +59,8 @@ class Div(Op):
 
 
 class Dot(Op):
+    __slots__ = ()
+
     def forward(self, x1: ArrayLike, x2: ArrayLike) -> ArrayLike:
         y = x1 @ x2
         self.save_to_cache(x1, x2)
@@ -64,6 +74,8 @@ class Dot(Op):
 
 
 class Maximum(Op):
+    __slots__ = ()
+
     def forward(self, x1: ArrayLike, x2: ArrayLike) -> ArrayLike:
         y = self.xp.maximum(x1, x2)
         self.save_to_cache(y == x1)
@@ -77,6 +89,8 @@ class Maximum(Op):
 
 
 class Minimum(Op):
+    __slots__ = ()
+
     def forward(self, x1: ArrayLike, x2: ArrayLike) -> ArrayLike:
         y = self.xp.minimum(x1, x2)
         self.save_to_cache(y == x1)
@@ -5,6 +5,8 @@ from emgrad.dtypes import ArrayLike, ShapeLike
 
 
 class Reshape(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, shape: ShapeLike) -> ArrayLike:
         self.save_to_cache(x.shape)
         y = self.xp.reshape(x, shape)
@@ -17,6 +19,8 @@ class Reshape(Op):
 
 
 class Concat(Op):
+    __slots__ = ()
+
     def forward(self, *arrays: ArrayLike, dim: int) -> ArrayLike:
         y = self.xp.concatenate(arrays, dim)
         self.save_to_cache(dim, [a.shape[dim] for a in arrays])
@@ -30,6 +34,8 @@ class Concat(Op):
 
 
 class Expand(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, shape: ShapeLike) -> ArrayLike:
         y = self.xp.broadcast_to(x, shape)
         return y
@@ -39,6 +45,8 @@ class Expand(Op):
 
 
 class Transpose(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, dim1: int, dim2: int) -> ArrayLike:
         y = x.swapaxes(dim1, dim2)
         self.save_to_cache(dim1, dim2)
@@ -51,6 +59,8 @@ class Transpose(Op):
 
 
 class Select(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, key: Any) -> ArrayLike:
         y = x[key]
         self.save_to_cache(x.shape, key)
@@ -64,10 +74,12 @@ class Select(Op):
 
 
 class Split(Select):
-    pass
+    __slots__ = ()
 
 
 class Stack(Op):
+    __slots__ = ()
+
     def forward(self, *arrays: ArrayLike | bool, dim: int) -> ArrayLike:
         y = self.xp.stack(arrays, dim)
         self.save_to_cache(dim)
@@ -80,6 +92,8 @@ class Stack(Op):
 
 
 class View(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, shape: ShapeLike) -> ArrayLike:
         y = self.xp.reshape(x, shape)
         self.save_to_cache(x.shape)
@@ -92,10 +106,12 @@ class View(Op):
 
 
 class Squeeze(View):
-    pass
+    __slots__ = ()
 
 
 class Where(Op):
+    __slots__ = ()
+
     def forward(self, condition: ArrayLike, x1: ArrayLike, x2: ArrayLike) -> ArrayLike:
         y = self.xp.where(condition, x1, x2)
         self.save_to_cache(y == x1)
@@ -4,6 +4,8 @@ from emgrad.dtypes import ArrayLike
 
 
 class Sum(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, dim: Optional[int | tuple[int, ...]], keepdims: bool) -> ArrayLike:
         y = x.sum(dim, keepdims=keepdims)
         self.save_to_cache(x.shape, dim, keepdims)
@@ -18,6 +20,8 @@ class Sum(Op):
 
 
 class Mean(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, dim: Optional[int | tuple[int, ...]], keepdims: bool) -> ArrayLike:
         y = x.mean(dim, keepdims=keepdims)
         self.save_to_cache(x.shape, dim, keepdims, x.size / y.size)
@@ -32,6 +36,8 @@ class Mean(Op):
 
 
 class Var(Op):
+    __slots__ = ()
+
     def forward(
             self,
             x: ArrayLike,
@@ -51,6 +57,8 @@ class Var(Op):
 
 
 class Std(Op):
+    __slots__ = ()
+
     def forward(
             self,
             x: ArrayLike,
@@ -71,6 +79,8 @@ class Std(Op):
 
 
 class Max(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, dim: Optional[int], keepdims: bool) -> ArrayLike:
         y = x.max(dim, keepdims=True)
         self.save_to_cache(dim, keepdims, x == y)
@@ -85,6 +95,8 @@ class Max(Op):
 
 
 class Min(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, dim: Optional[int], keepdims: bool) -> ArrayLike:
         y = x.min(dim, keepdims=True)
         self.save_to_cache(dim, keepdims, x == y)
@@ -3,6 +3,8 @@ from emgrad.dtypes import ArrayLike, Scalar
 
 
 class Abs(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike) -> ArrayLike:
         y = self.xp.absolute(x)
         self.save_to_cache(y != x)
@@ -16,6 +18,8 @@ class Abs(Op):
 
 
 class Exp(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike) -> ArrayLike:
         y = self.xp.exp(x)
         self.save_to_cache(y)
@@ -28,6 +32,8 @@ class Exp(Op):
 
 
 class Log(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike) -> ArrayLike:
         y = self.xp.log(x)
         self.save_to_cache(x)
@@ -40,6 +46,8 @@ class Log(Op):
 
 
 class Pow(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, power: Scalar) -> ArrayLike:
         y = x ** power
         self.save_to_cache(x, power)
@@ -52,6 +60,8 @@ class Pow(Op):
 
 
 class Sqrt(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike) -> ArrayLike:
         y = self.xp.sqrt(x)
         self.save_to_cache(y)
@@ -64,6 +74,8 @@ class Sqrt(Op):
 
 
 class Tanh(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike) -> ArrayLike:
         y = self.xp.tanh(x)
         self.save_to_cache(y)
@@ -76,6 +88,8 @@ class Tanh(Op):
 
 
 class Tril(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, diag: int) -> ArrayLike:
         y = self.xp.tril(x, diag)
         self.save_to_cache(y == x)
@@ -88,6 +102,8 @@ class Tril(Op):
 
 
 class Triu(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, diag: int) -> ArrayLike:
         y = self.xp.triu(x, diag)
         self.save_to_cache(y == x)
@@ -24,7 +24,7 @@ __all__ = [
 def _parse_factory_kwargs(
         device: Optional[DeviceLike], dtype: Optional[DType]
 ) -> tuple[Device, DType]:
-    device = select_device(device)
+    device = parse_device(device)
     dtype = select_dtype(dtype)
     return device, dtype
 
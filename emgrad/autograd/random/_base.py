@@ -1,8 +1,9 @@
-from typing import Optional
+import math
+from typing import Any, Optional
 
-from emgrad.autograd import *
-from emgrad.dtypes import *
-from emgrad._backends import *
+from emgrad.dtypes import ArrayLike, DType, float16, float32, float64, int64
+from emgrad._backends import Device, DeviceLike, set_random_seed, _get_random_generator, _get_rng_generation
+from .._tensor import Tensor
 from .._tensor_func import _parse_factory_kwargs
 
 __all__ = [
@@ -18,6 +19,66 @@ __all__ = [
 ]
 
 
+_cuda_affine_kernel: Any = None
+
+
+def _draw_dtype(dtype: DType) -> DType:
+    return float64 if dtype == float64 else float32
+
+
+def _affine(
+        device: Device, x: ArrayLike, scale: float, shift: float, dtype: DType, copy: bool = False
+) -> ArrayLike:
+    # `x` is freshly drawn scratch memory in float32/float64; the result is produced in `dtype`
+    # so low-precision outputs are written once instead of being scaled after a separate cast.
+    identity = scale == 1 and shift == 0
+    if device.dev_type == "cpu":
+        if scale != 1:
+            device.xp.multiply(x, scale, out=x)
+        if shift != 0:
+            device.xp.add(x, shift, out=x)
+        return x.astype(dtype, copy=copy)
+    if identity:
+        return x.astype(dtype, copy=copy)
+    global _cuda_affine_kernel
+    if _cuda_affine_kernel is None:
+        _cuda_affine_kernel = device.xp.ElementwiseKernel(
+            "T x, T scale, T shift", "O y", "y = x * scale + shift", "emgrad_affine"
+        )
+    y = x if x.dtype == dtype and not copy else device.xp.empty(x.shape, dtype)
+    _cuda_affine_kernel(x, scale, shift, y)
+    return y
+
+
+class _RandomPool:
+    # Small CUDA draws are served from a large pre-drawn chunk per device and stream, so a
+    # training loop asking for many small noise tensors pays one RNG launch per chunk.
+    def __init__(self, pool_size: int) -> None:
+        self.pool_size = pool_size
+        self.max_take = pool_size // 16
+        self._generation = -1
+        self._normal: dict[tuple[int, int], tuple[ArrayLike, int]] = {}
+
+    def take_standard_normal(self, device: Device, n: int) -> ArrayLike:
+        generation = _get_rng_generation()
+        if generation != self._generation:
+            self._normal.clear()
+            self._generation = generation
+        # Chunks are stream-local: slices are read in the order they were drawn and freed.
+        key = (device.xp.cuda.get_device_id(), device.xp.cuda.get_current_stream().ptr)
+        entry = self._normal.get(key)
+        if entry is None or entry[1] + n > self.pool_size:
+            buf = _get_random_generator(device).standard_normal(size=self.pool_size, dtype=float32)
+            offset = 0
+        else:
+            buf, offset = entry
+        self._normal[key] = (buf, offset + n)
+        return buf[offset:offset + n]
+
+
+_pool = _RandomPool(1 << 20)
+
+
 def seed(_seed: int) -> None:
     set_random_seed(_seed)
 
@@ -27,7 +88,8 @@ def rand(
 ) -> Tensor:
     device, dtype = _parse_factory_kwargs(device, dtype)
     with device:
-        data = device.xp.random.rand(shape).astype(dtype)
+        rng = _get_random_generator(device)
+        data = rng.random(size=shape, dtype=_draw_dtype(dtype)).astype(dtype, copy=False)
     return Tensor(data, req_grad=req_grad)
 
 
@@ -41,7 +103,11 @@ def randint(
 ) -> Tensor:
     device, dtype = _parse_factory_kwargs(device, dtype)
     with device:
-        data = device.xp.random.randint(low, high, shape, dtype)
+        rng = _get_random_generator(device)
+        if device.dev_type == "cpu":
+            data = rng.integers(low, high, size=shape, dtype=dtype)
+        else:
+            data = rng.randint(low, high, size=shape, dtype=dtype)
     return Tensor(data, req_grad=req_grad)
 
 
@@ -61,7 +127,13 @@ def randn(
 ) -> Tensor:
     device, dtype = _parse_factory_kwargs(device, dtype)
     with device:
-        data = device.xp.random.normal(mean, std, shape).astype(dtype)
+        n = math.prod(shape)
+        if device.dev_type == "cuda" and n <= _pool.max_take and dtype in (float16, float32):
+            x = _pool.take_standard_normal(device, n).reshape(shape)
+            data = _affine(device, x, std, mean, dtype, copy=True)
+        else:
+            x = _get_random_generator(device).standard_normal(size=shape, dtype=_draw_dtype(dtype))
+            data = _affine(device, x, std, mean, dtype)
     return Tensor(data, req_grad=req_grad)
 
 
@@ -83,7 +155,8 @@ def uniform(
 ) -> Tensor:
     device, dtype = _parse_factory_kwargs(device, dtype)
     with device:
-        data = device.xp.random.uniform(low, high, shape).astype(dtype)
+        x = _get_random_generator(device).random(size=shape, dtype=_draw_dtype(dtype))
+        data = _affine(device, x, high - low, low, dtype)
     return Tensor(data, req_grad=req_grad)
 
 
@@ -103,5 +176,10 @@ def permutation(
 ) -> Tensor:
     device, dtype = _parse_factory_kwargs(device, dtype)
     with device:
-        data = device.xp.random.permutation(n).astype(dtype)
+        if device.dev_type == "cpu":
+            data = device.xp.arange(n, dtype=dtype)
+            _get_random_generator(device).shuffle(data)
+        else:
+            # cupy.random.shuffle gathers through an int64 permutation anyway, so skip the arange.
+            data = device.xp.random.permutation(n).astype(dtype, copy=False)
     return Tensor(data, req_grad=req_grad)
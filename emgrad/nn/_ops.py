@@ -9,6 +9,8 @@ def _sigmoid_fwd(xp: ModuleType, x: ArrayLike) -> ArrayLike:
 
 
 class Sigmoid(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike) -> ArrayLike:
         y = _sigmoid_fwd(self.xp, x)
         self.save_to_cache(y)
@@ -21,6 +23,8 @@ class Sigmoid(Op):
 
 
 class ReLU(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike) -> ArrayLike:
         y = self.xp.maximum(x, 0.0)
         self.save_to_cache(y == x)
@@ -33,6 +37,8 @@ class ReLU(Op):
 
 
 class LeakyReLU(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, alpha: float) -> ArrayLike:
         y = self.xp.maximum(x, x * alpha)
         self.save_to_cache(alpha, y == x)
@@ -45,6 +51,8 @@ class LeakyReLU(Op):
 
 
 class GELU(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike) -> ArrayLike:
         y = 0.5 * x * (1 + self.xp.tanh(x * 0.7978845608 * (1 + 0.044715 * x * x)))
         self.save_to_cache(x)
@@ -67,6 +75,8 @@ def _softmax_bwd(y: ArrayLike, dy: ArrayLike, dim: int) -> ArrayLike:
 
 
 class Softmax(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, dim: int) -> ArrayLike:
         y = _softmax_fwd(self.xp, x, dim)
         self.save_to_cache(dim, y)
@@ -79,6 +89,8 @@ class Softmax(Op):
 
 
 class Linear(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, w: ArrayLike, b: Optional[ArrayLike]) -> ArrayLike:
         y = x @ w.swapaxes(-1, -2)
         y = y if b is None else y + b
@@ -111,6 +123,8 @@ def _pad1d_bwd(
 
 
 class Pad1D(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, padding: int) -> ArrayLike:
         y = _pad1d_fwd(self.xp, x, padding, padding)
         self.save_to_cache(padding)
@@ -135,6 +149,8 @@ def _dilate1d_bwd(dy: ArrayLike, dilation: int) -> ArrayLike:
 
 
 class Dilate1D(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, dilation: int) -> ArrayLike:
         y = _dilate1d_fwd(self.xp, x, dilation)
         self.save_to_cache(dilation)
@@ -166,6 +182,8 @@ def _windowed_view_1d(
 
 
 class Conv1D(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, w: ArrayLike, *, stride: int) -> ArrayLike:
         kernel_size = w.shape[-1]
 
@@ -218,6 +236,8 @@ def _pad2d_bwd(
 
 
 class Pad2D(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, padding: int) -> ArrayLike:
         y = _pad2d_fwd(self.xp, x, padding, padding)
         self.save_to_cache(padding)
@@ -230,6 +250,8 @@ class Pad2D(Op):
 
 
 class OutPad2D(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, padding: int, output_padding: int) -> ArrayLike:
         y = _pad2d_bwd(x, padding, padding - output_padding)
         self.save_to_cache(padding, output_padding)
@@ -254,6 +276,8 @@ def _dilate2d_bwd(dy: ArrayLike, dilation: int) -> ArrayLike:
 
 
 class Dilate2D(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, dilation: int) -> ArrayLike:
         y = _dilate2d_fwd(self.xp, x, dilation)
         self.save_to_cache(dilation)
@@ -280,6 +304,8 @@ def _windowed_view_2d(
 
 
 class Conv2D(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, w: ArrayLike, *, stride: int) -> ArrayLike:
         kernel_size = w.shape[-1]
 
@@ -315,6 +341,8 @@ class Conv2D(Op):
 
 
 class ConvTranspose2D(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, w: ArrayLike, *, stride: int) -> ArrayLike:
         kernel_size = w.shape[-1]
 
@@ -360,6 +388,8 @@ def _repeat2d(xp: ModuleType, x: ArrayLike, n_repeats: int, target_shape: ShapeL
 
 
 class MaxPool2D(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, window_size: int) -> ArrayLike:
         y = _windowed_view_2d(self.xp, x, window_size, window_size).max((-2, -1))
         self.save_to_cache(x, window_size, y)
@@ -386,6 +416,8 @@ def _dropout_bwd(dy: ArrayLike, dropout_mask: ArrayLike, p: float) -> ArrayLike:
 
 
 class Dropout(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, p: float) -> ArrayLike:
         dropout_mask = _dropout_mask(self.xp, x.shape, p)
         y = _dropout_fwd(x, dropout_mask, p)
@@ -399,6 +431,8 @@ class Dropout(Op):
 
 
 class ScaledDotProductAttention(Op):
+    __slots__ = ()
+
     def forward(
             self,
             q: ArrayLike,
@@ -443,6 +477,8 @@ class ScaledDotProductAttention(Op):
 
 
 class BatchNorm(Op):
+    __slots__ = ()
+
     def forward(
             self,
             x: ArrayLike,
@@ -497,6 +533,8 @@ class BatchNorm(Op):
 
 
 class LayerNorm(Op):
+    __slots__ = ()
+
     def forward(
             self, x: ArrayLike, w: ArrayLike, b: ArrayLike, *, eps: float
     ) -> ArrayLike:
@@ -528,6 +566,8 @@ class LayerNorm(Op):
 
 
 class Embedding(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, *, key: Any) -> ArrayLike:
         y = x[key]
         self.save_to_cache(x.shape, key)
@@ -545,6 +585,8 @@ def _onehot(xp: ModuleType, x: ArrayLike, n: int, dtype: type):
 
 
 class MSELoss(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, y: ArrayLike, *, reduction: str) -> ArrayLike:
         diff = x - y
         loss = diff * diff
@@ -561,6 +603,8 @@ class MSELoss(Op):
 
 
 class CrossEntropyLoss(Op):
+    __slots__ = ()
+
     def forward(
             self, x: ArrayLike, y: ArrayLike, *, eta: float, reduction: str
     ) -> ArrayLike:
@@ -581,6 +625,8 @@ class CrossEntropyLoss(Op):
 
 
 class BCELoss(Op):
+    __slots__ = ()
+
     def forward(self, x: ArrayLike, y: ArrayLike, *, reduction: str) -> ArrayLike:
         max_logits = self.xp.maximum(x, 0.0)
         loss = max_logits - x * y + self.xp.log(1 + self.xp.exp(-self.xp.abs(x)))
@@ -1,4 +1,5 @@
-from functools import reduce
+import itertools
+import math
 from typing import Literal
 from emgrad.autograd import Tensor
 from emgrad._backends import get_nn_device
@@ -14,6 +15,7 @@ __all__ = [
     "xavier_normal",
     "kaiming_uniform",
     "kaiming_normal",
+    "kaiming_uniform_batch",
 ]
 
 
@@ -22,8 +24,13 @@ def _calculate_fan_in_and_fan_out(*shape: int) -> tuple[int, int]:
         fan_in = shape[0]
         fan_out = shape[1]
 
-    elif len(shape) in [3, 4, 5]:
-        kernel_prod = reduce(lambda x, y: x * y, shape[2:], 1)
+    elif len(shape) == 4:
+        kernel_prod = shape[2] * shape[3]
+        fan_in = shape[1] * kernel_prod
+        fan_out = shape[0] * kernel_prod
+
+    elif len(shape) in [3, 5]:
+        kernel_prod = math.prod(shape[2:])
         fan_in = shape[1] * kernel_prod
         fan_out = shape[0] * kernel_prod
 
@@ -73,5 +80,26 @@ def kaiming_normal(*shape: int, mode: FanMode = "fan_in", req_grad: bool = False
         raise ValueError("mode must be either 'fan_in' or 'fan_out'.")
     fan_in, fan_out = _calculate_fan_in_and_fan_out(*shape)
     fan = fan_in if mode == "fan_in" else fan_out
-    std = (2 / fan) ** 5
+    std = (2 / fan) ** 0.5
     return ad.random.randn(*shape, mean=0, std=std, device=get_nn_device(), req_grad=req_grad)
+
+
+def kaiming_uniform_batch(
+        *shapes: tuple[int, ...], mode: FanMode = "fan_in", req_grad: bool = False
+) -> list[Tensor]:
+    if mode not in {"fan_in", "fan_out"}:
+        raise ValueError("mode must be either 'fan_in' or 'fan_out'.")
+    fan_index = 0 if mode == "fan_in" else 1
+    bounds = [(6 / _calculate_fan_in_and_fan_out(*shape)[fan_index]) ** 0.5 for shape in shapes]
+    sizes = [math.prod(shape) for shape in shapes]
+
+    # One draw for all weights; each result is a view into the shared buffer, scaled in place.
+    device = get_nn_device()
+    xp = device.xp
+    with device:
+        data = ad.random.uniform(sum(sizes), device=device).data
+        offsets = list(itertools.accumulate(sizes))[:-1]
+        chunks = xp.split(data, offsets)
+        for chunk, bound in zip(chunks, bounds):
+            xp.multiply(chunk, data.dtype.type(bound), out=chunk)
+    return [Tensor(chunk.reshape(shape), req_grad=req_grad) for chunk, shape in zip(chunks, shapes)]
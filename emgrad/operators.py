@@ -6,6 +6,8 @@ from emgrad.dtypes import ArrayLike
 
 
 class Op(ABC):
+    __slots__ = ("xp", "kwargs", "_cache")
+
     def __init__(self, device: Device, **kwargs: Any) -> None:
         self.xp = device.xp
         self.kwargs = kwargs
@@ -5,7 +5,7 @@ from torch import Tensor as _Tensor
 import emgrad as ed
 from emgrad import *
 
-np.random.seed(0)
+ed.random.seed(0)
 
 
 def close(ol_in: ArrayLike, torch_in: _Tensor, tol: float = 1e-5):